@@ -224,7 +224,7 @@ class Album(models.Model):
         Returns all tracks in our album, ordered.  A convenience function
         for inclusion in templates, basically.
         """
-        return self.song_set.all().order_by('tracknum')
+        return self.song_set.all().select_related('artist').order_by('tracknum')
 
     def get_songs_jplayer_streamable_ordered(self):
         """
@@ -232,7 +232,7 @@ class Album(models.Model):
         via jPlayer, ordered.  A convenience function for inclusion in
         templates, basically.
         """
-        return self.song_set.all().filter(~Q(filetype=Song.OPUS)).order_by('tracknum')
+        return self.song_set.all().filter(~Q(filetype=Song.OPUS)).select_related('artist').order_by('tracknum')
 
     def get_secondary_artists_list(self):
         """
@@ -497,12 +497,14 @@ class Album(models.Model):
             timestamp = datetime.datetime.fromtimestamp(os.path.getmtime(zip_full))
             raise App.AlbumZipfileAlreadyExists(zip_filename, timestamp)
 
-        # Loop through and collect raw filenames
-        songs = self.song_set.order_by('tracknum')
-        filenames_raw = []
+        # Loop through and collect raw filenames.  Sorting here rather than
+        # in the DB lets us make use of songs which have been prefetched.
+        # Falling back to the filename keeps albums without track numbers
+        # in a stable order.  Our base path preference is only looked up once.
+        songs = sorted(self.song_set.all(), key=lambda song: (song.tracknum, song.filename))
+        base_path = App.prefs['exordium__base_path']
+        filenames_raw = [song.full_filename(base_path) for song in songs]
         filenames_inzip = []
-        for song in songs:
-            filenames_raw.append(song.full_filename())
         if self.has_album_art():
             filenames_raw.append(self.get_original_art_filename())
 
@@ -525,22 +527,19 @@ class Album(models.Model):
                     os.path.join(zip_container, filename[len(common_dir)+1:])
                 )
 
-        # Now actually get to work
+        # Now actually get to work.  ``ZIP_STORED`` is already ZipFile's
+        # default; it's only spelled out to document that members are
+        # stored as-is, since music and album art are already compressed
+        # and deflating them would just cost CPU.  Zipfiles can't support
+        # dates before 1980, and it seems that I've got at least a file or
+        # two whose date is before then.  Those should be updated, certainly,
+        # but in the meantime ``strict_timestamps=False`` has them stored
+        # as 1980-01-01 rather than erroring out.
         try:
-            with zipfile.ZipFile(zip_full, 'w') as zf:
+            with zipfile.ZipFile(zip_full, 'w', compression=zipfile.ZIP_STORED,
+                    strict_timestamps=False) as zf:
                 for (raw, inzip) in zip(filenames_raw, filenames_inzip):
-                    try:
-                        zf.write(raw, arcname=inzip)
-                    except ValueError:
-                        # Zipfiles can't support dates before 1980, and it seems
-                        # that I've got at least a file or two whose date is before
-                        # then.  Those should be updated, certainly, but this is
-                        # an annoying exception with no GOOD way to go about it
-                        # apart from loading in the file data ourself.  Lame.  Would
-                        # be nice if there was a flag that said "give invalid dates
-                        # some fake info" instead.
-                        with open(raw, 'rb') as df:
-                            zf.writestr(inzip, df.read())
+                    zf.write(raw, arcname=inzip)
         except Exception as e:  # pragma: no cover
             try:
                 os.remove(zip_full)
@@ -765,12 +764,16 @@ class Song(models.Model):
         """
         return self.title
 
-    def full_filename(self):
+    def full_filename(self, base_path=None):
         """
-        Returns our full path (including library prefix)
+        Returns our full path (including library prefix).  Callers working
+        through a lot of songs can pass in ``base_path`` to avoid looking
+        up our library preference for each one.
         """
-        App.ensure_prefs()
-        return os.path.join(App.prefs['exordium__base_path'], self.filename)
+        if base_path is None:
+            App.ensure_prefs()
+            base_path = App.prefs['exordium__base_path']
+        return os.path.join(base_path, self.filename)
 
     def base_dir(self):
         """
@@ -1,4 +1,6 @@
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.utils import timezone
 
 from django.contrib.auth.models import User
@@ -6,7 +8,9 @@ from django.contrib.auth.models import User
 from dynamic_preferences.registries import global_preferences_registry
 
 import os
+import re
 import shutil
+import contextlib
 import pathlib
 import datetime
 import tempfile
@@ -18,10 +22,9 @@ from mutagen.mp4 import MP4
 
 from exordium.models import Artist, Album, Song, App, AlbumArt
 
-# These two imports are just here in case we want to examine SQL while running tests.
+# This import is just here in case we want to examine SQL while running tests.
 # If so, set "settings.DEBUG = True" in the test and then use connection.queries
 #from django.conf import settings
-#from django.db import connection
 
 class ExordiumTests(TestCase):
     """
@@ -38,6 +41,9 @@ class ExordiumTests(TestCase):
 
     prefs = None
 
+    # Used by ``assertNumLibraryQueries()``
+    library_table_re = re.compile(r'\bexordium_\w+')
+
     def setUp(self):
         """
         Run automatically at the start of any test.  Ensure that there's no
@@ -734,6 +740,122 @@ class ExordiumTests(TestCase):
 
         self.add_file(basefile, filename, path=path)
 
+    @classmethod
+    def create_album(cls, songs, artist='Artist', album='Album', year=0,
+            miscellaneous=False, art=False):
+        """
+        Creates an album directly in the database, without writing any
+        music files to our library or going through ``run_add()``, which
+        is by far the slowest part of most of our tests.  Useful for tests
+        which only care about how things get displayed.
+
+        ``songs`` is a list of dicts describing each track, which may
+        contain any of ``title``, ``tracknum``, ``artist``, ``group``,
+        ``conductor``, ``composer``, ``filetype``, ``filename``, and
+        ``length``.  Tracks default to being by the album artist, and will
+        otherwise be given the same defaults as the files we'd get from
+        ``add_mp3()``.  Use ``artist='Various'`` for a various-artists album.
+        Any artists which don't already exist will be created, and the
+        songs themselves are inserted with a single ``bulk_create``.
+
+        Pass ``True`` for ``art`` to have the album look as if ``run_add()``
+        had found a ``cover.jpg`` for it.  The image itself is not written
+        to the library, so that this can be called from ``setUpTestData()``,
+        before our library even exists - use ``add_art()`` if you need the
+        actual file.
+
+        Returns the new Album object.
+        """
+
+        # Figure out all the artists we need, and create any which are
+        # missing.  Artist.save() would normally populate normname for us,
+        # but bulk_create() skips that.
+        names = {artist}
+        for song in songs:
+            for key in ['artist', 'group', 'conductor', 'composer']:
+                if song.get(key, '') != '':
+                    names.add(song[key])
+        prefixed = {name: Artist.extract_prefix(name) for name in names}
+        existing = set(Artist.objects.filter(
+            name__in=[name for (prefix, name) in prefixed.values()]).values_list('name', flat=True))
+        Artist.objects.bulk_create([
+            Artist(name=name, normname=App.norm_name(name), prefix=prefix)
+            for (prefix, name) in prefixed.values() if name not in existing
+        ])
+        artists = {a.name: a for a in Artist.objects.filter(
+            name__in=[name for (prefix, name) in prefixed.values()])}
+        artist_objs = {orig: artists[name] for (orig, (prefix, name)) in prefixed.items()}
+
+        album_obj = Album.objects.create(artist=artist_objs[artist], name=album,
+            year=year, miscellaneous=miscellaneous)
+        if art:
+            album_obj.art_filename = 'cover.jpg'
+            album_obj.art_ext = 'jpg'
+            album_obj.art_mime = 'image/jpeg'
+            album_obj.save()
+
+        song_objs = []
+        for (idx, song) in enumerate(songs):
+            filetype = song.get('filetype', Song.MP3)
+            song_artist = artist_objs[song.get('artist', artist)]
+            title = song.get('title', 'Title %d' % (idx+1))
+            secondary = {}
+            for key in ['group', 'conductor', 'composer']:
+                if song.get(key, '') != '':
+                    secondary[key] = artist_objs[song[key]]
+                    secondary['raw_%s' % (key)] = artist_objs[song[key]].name
+            song_objs.append(Song(filename=song.get('filename', 'song%d.%s' % (idx+1, filetype)),
+                album=album_obj,
+                artist=song_artist,
+                raw_artist=song_artist.name,
+                title=title,
+                normtitle=App.norm_name(title),
+                year=year,
+                tracknum=song.get('tracknum', 0),
+                filetype=filetype,
+                bitrate=128000,
+                mode=Song.CBR,
+                size=123000,
+                length=song.get('length', 2),
+                sha256sum='0cf31fc7d968ec16c69758f9b0ebb2355471d5694a151b40e5e4f8641b061092',
+                **secondary))
+        Song.objects.bulk_create(song_objs)
+
+        return album_obj
+
+    def assertAllIn(self, needles, body):
+        """
+        Ensures that every string in ``needles`` can be found in ``body``.
+        On failure, reports all the missing strings at once, rather than
+        dumping ``body`` for the first one we hit.
+        """
+        missing = [needle for needle in needles if needle not in body]
+        self.assertEqual(missing, [], msg='%d string(s) not found in body' % (len(missing)))
+
+    def assertNoneIn(self, needles, body):
+        """
+        Ensures that none of the strings in ``needles`` can be found in
+        ``body``.  On failure, reports all the strings which were found.
+        """
+        found = [needle for needle in needles if needle in body]
+        self.assertEqual(found, [], msg='%d string(s) unexpectedly found in body' % (len(found)))
+
+    @contextlib.contextmanager
+    def assertNumLibraryQueries(self, num):
+        """
+        Like ``assertNumQueries()``, but only counts queries which touch
+        our own tables (artists, albums, songs and album art).  Preference,
+        session and user lookups are left out, since whether or not those
+        hit the database depends on the ``CACHES`` setting of whatever
+        project we're running in.
+        """
+        with CaptureQueriesContext(connection) as context:
+            yield
+        queries = [query['sql'] for query in context.captured_queries
+            if self.library_table_re.search(query['sql'])]
+        self.assertEqual(len(queries), num, msg='%d library queries executed, %d expected:\n%s' % (
+            len(queries), num, '\n'.join(queries)))
+
     def assertNoErrors(self, appresults):
         """
         Given a list of tuples (as returned from ``App.add()`` or ``App.update()``),
@@ -1,12 +1,28 @@
 from .base import ExordiumUserTests
 
+from django.test import SimpleTestCase, RequestFactory, override_settings
 from django.urls import reverse
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+
+from unittest import mock
 
 from exordium.models import Artist, Album, Song, App, AlbumArt
 from exordium.views import UserAwareView, IndexView
 
+# What our preferences checkbox looks like in the rendered page when it's checked
+SHOW_LIVE_CHECKED = b'"show_live" checked'
+
+# Our anonymous-user tests lean on the session quite a bit; storing it in
+# signed cookies rather than the default DB backend saves a few queries on
+# every request.
+prefs_settings = override_settings(
+    SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies',
+)
+
 # TODO: Really we should convert our preference form to a django.form.Form
 # and test the full submission, rather than just faking a POST.
+@prefs_settings
 class UserPreferenceTests(ExordiumUserTests):
     """
     Tests of our user-based preferences, which for the purpose of this
@@ -16,97 +32,106 @@ class UserPreferenceTests(ExordiumUserTests):
     it should just be stored in our session.
     """
 
-    def test_show_live_anonymous(self):
+    def assertShowLiveState(self, response, expected, in_session, checked):
         """
-        Test the behavior when we're anonymous.  Should be stored just
-        in the session.
+        Given a ``response`` from a page render, ensure that our ``show_live``
+        preference has the value ``expected``, that it is (or is not) stored
+        in the session as specified by ``in_session``, and that the checkbox
+        in our preferences form is rendered as ``checked`` (or not), both
+        in the template context and in the page itself.
+
+        For logged-in users, ``get_preference_static()`` reads straight from
+        the user preferences, so between that and the session check we've
+        verified where the value is stored without having to look it up
+        a second time.
         """
-
-        # First up - our default show_live should be None
-        response = self.client.get(reverse('exordium:index'))
-        self.assertEqual(UserAwareView.get_preference_static(response.wsgi_request, 'show_live'), None)
-        self.assertNotIn('exordium__show_live', response.wsgi_request.session)
-
-        # Check to make sure our checkbox is in the state we expect
-        self.assertNotContains(response, '"show_live" checked')
-
-        # Next: submit our preferences form to enable show_live.
-        response = self.client.post(reverse('exordium:updateprefs'), {'show_live': 'yes'})
-        self.assertRedirects(response, reverse('exordium:index'), fetch_redirect_response=False)
-        response = self.client.get(reverse('exordium:index'))
-        self.assertEqual(UserAwareView.get_preference_static(response.wsgi_request, 'show_live'), True)
-        self.assertIn('exordium__show_live', response.wsgi_request.session)
-        self.assertEqual(response.wsgi_request.session['exordium__show_live'], True)
-        self.assertContains(response, 'Set user preferences')
-
-        # Check to make sure our checkbox is in the state we expect
-        self.assertContains(response, '"show_live" checked')
-
-        # And now, submit one more, flipping back to False.
-        response = self.client.post(reverse('exordium:updateprefs'), {})
-        self.assertRedirects(response, reverse('exordium:index'), fetch_redirect_response=False)
-        response = self.client.get(reverse('exordium:index'))
-        self.assertEqual(UserAwareView.get_preference_static(response.wsgi_request, 'show_live'), False)
-        self.assertIn('exordium__show_live', response.wsgi_request.session)
-        self.assertEqual(response.wsgi_request.session['exordium__show_live'], False)
-        self.assertContains(response, 'Set user preferences')
-
-        # Check to make sure our checkbox is in the state we expect
-        self.assertNotContains(response, '"show_live" checked')
-
-    def test_show_live_user(self):
+        request = response.wsgi_request
+        self.assertEqual(UserAwareView.get_preference_static(request, 'show_live'), expected)
+        if in_session:
+            self.assertIn('exordium__show_live', request.session)
+            self.assertEqual(request.session['exordium__show_live'], expected)
+        else:
+            self.assertNotIn('exordium__show_live', request.session)
+        if checked:
+            self.assertTrue(response.context['show_live'])
+            self.assertIn(SHOW_LIVE_CHECKED, response.content)
+        else:
+            self.assertFalse(response.context['show_live'])
+            self.assertNotIn(SHOW_LIVE_CHECKED, response.content)
+
+    def test_show_live(self):
         """
-        Test the behavior when we're logged in.  Should be stored in
+        Test the behavior of our ``show_live`` preference, both when we're
+        anonymous and when we're logged in.  When anonymous, it should be
+        stored just in the session.  When logged in, it should be stored in
         our user preferences, and avoid the session entirely.
         """
-        
-        # Log in!
-        self.login()
-
-        # Now, our default show_live should be False
-        response = self.client.get(reverse('exordium:index'))
-        self.assertEqual(UserAwareView.get_preference_static(response.wsgi_request, 'show_live'), False)
-        self.assertNotIn('exordium__show_live', response.wsgi_request.session)
-        self.assertEqual(response.wsgi_request.user.preferences['exordium__show_live'], False)
-
-        # Check to make sure our checkbox is in the state we expect
-        self.assertNotContains(response, '"show_live" checked')
-
-        # Next: submit our preferences form to enable show_live.  Actually loading
-        # the index again here isn't really required, but this simulates a browser,
-        # so I dig it.
-        response = self.client.post(reverse('exordium:updateprefs'), {'show_live': 'yes'})
-        self.assertRedirects(response, reverse('exordium:index'), fetch_redirect_response=False)
-        response = self.client.get(reverse('exordium:index'))
-        self.assertEqual(UserAwareView.get_preference_static(response.wsgi_request, 'show_live'), True)
-        self.assertNotIn('exordium__show_live', response.wsgi_request.session)
-        self.assertEqual(response.wsgi_request.user.preferences['exordium__show_live'], True)
-        self.assertContains(response, 'Set user preferences')
-
-        # Check to make sure our checkbox is in the state we expect
-        self.assertContains(response, '"show_live" checked')
-
-        # And now, submit one more, flipping back to False.  Once again, the extra
-        # redirect to index is a bit gratuitous.
-        response = self.client.post(reverse('exordium:updateprefs'), {})
-        self.assertRedirects(response, reverse('exordium:index'), fetch_redirect_response=False)
-        response = self.client.get(reverse('exordium:index'))
-        self.assertEqual(UserAwareView.get_preference_static(response.wsgi_request, 'show_live'), False)
-        self.assertNotIn('exordium__show_live', response.wsgi_request.session)
-        self.assertEqual(response.wsgi_request.user.preferences['exordium__show_live'], False)
-        self.assertContains(response, 'Set user preferences')
-
-        # Check to make sure our checkbox is in the state we expect
-        self.assertNotContains(response, '"show_live" checked')
-
-    def test_preferences_referer_redirect(self):
+
+        index_url = reverse('exordium:index')
+        prefs_url = reverse('exordium:updateprefs')
+
+        # Anonymous users default to None, since there's nothing in the
+        # session, whereas logged-in users get the preference default.
+        for (logged_in, default) in [(False, None), (True, False)]:
+            with self.subTest(logged_in=logged_in):
+
+                # Start each pass with a fresh client, so that the anonymous
+                # session doesn't carry over into our login.
+                client = self.client_class()
+                if logged_in:
+                    client.force_login(self.user)
+                in_session = not logged_in
+
+                # First up - check our default show_live.  Merely reading an unset
+                # preference shouldn't cause the session to be written out.
+                response = client.get(index_url)
+                self.assertShowLiveState(response, default, in_session=False, checked=False)
+                self.assertFalse(response.wsgi_request.session.modified)
+
+                # Next: submit our preferences form to enable show_live.  Following the
+                # redirect back to the index simulates a browser, so I dig it.
+                response = client.post(prefs_url, {'show_live': 'yes'}, follow=True)
+                self.assertRedirects(response, index_url)
+                self.assertShowLiveState(response, True, in_session=in_session, checked=True)
+                self.assertIn('Set user preferences', response.context['messages_success'])
+
+                # And now, submit one more, flipping back to False.
+                response = client.post(prefs_url, {}, follow=True)
+                self.assertRedirects(response, index_url)
+                self.assertShowLiveState(response, False, in_session=in_session, checked=False)
+                self.assertIn('Set user preferences', response.context['messages_success'])
+
+    def test_updateprefs_ignores_unknown_keys(self):
+        """
+        Only the preferences on our preferences form get set from the POST;
+        anything else in there should be ignored.
+        """
+
+        response = self.client.post(reverse('exordium:updateprefs'),
+            {'show_live': 'yes', 'not_a_pref': 'yes'}, follow=True)
+        self.assertRedirects(response, reverse('exordium:index'))
+        self.assertShowLiveState(response, True, in_session=True, checked=True)
+        self.assertNotIn('exordium__not_a_pref', response.wsgi_request.session)
+
+@prefs_settings
+class UserPreferenceSessionOnlyTests(SimpleTestCase):
+    """
+    Preference tests which only ever touch the session, and therefore
+    don't need any database access (or the library setup from
+    ``ExordiumTests``) at all.
+    """
+
+    @mock.patch('exordium.views.UserAwareView.set_preference_static')
+    def test_preferences_referer_redirect(self, set_preference_static):
         """
         After a preference submission, we should be returned to the page
-        we started on.
+        we started on.  We only care about the redirect here, so the
+        preference save itself is skipped.
         """
-        
+
         response = self.client.post(reverse('exordium:updateprefs'), {}, HTTP_REFERER=reverse('exordium:browse_artist'))
-        self.assertRedirects(response, reverse('exordium:browse_artist'))
+        self.assertRedirects(response, reverse('exordium:browse_artist'), fetch_redirect_response=False)
+        set_preference_static.assert_any_call(mock.ANY, 'show_live', False)
 
     def test_non_static_set_preference(self):
         """
@@ -115,17 +140,20 @@ class UserPreferenceTests(ExordiumUserTests):
         since it makes sense to be in there.  So here's a test for it.
         """
 
+        # We don't need a whole page render for this, just an anonymous
+        # request with a session attached.
+        request = RequestFactory().get(reverse('exordium:index'))
+        request.user = AnonymousUser()
+        request.session = SessionStore()
+
         # First up - our default show_live should be None
-        response = self.client.get(reverse('exordium:index'))
-        self.assertEqual(UserAwareView.get_preference_static(response.wsgi_request, 'show_live'), None)
-        self.assertNotIn('exordium__show_live', response.wsgi_request.session)
+        self.assertEqual(UserAwareView.get_preference_static(request, 'show_live'), None)
+        self.assertNotIn('exordium__show_live', request.session)
 
-        # This is a bit hokey - I'm actually not really sure how to correctly
-        # instansiate a view object with a request so that I can make calls as
-        # if I'm currently in the view.  This seems to work, though, so whatever.
+        # Instantiate a view object and attach our request to it, so that we
+        # can make calls as if we're currently in the view.
         view = IndexView()
-        view.request = response.wsgi_request
+        view.setup(request)
         view.set_preference('show_live', True)
-        self.assertIn('exordium__show_live', response.wsgi_request.session)
-        self.assertEqual(response.wsgi_request.session['exordium__show_live'], True)
-
+        self.assertIn('exordium__show_live', request.session)
+        self.assertEqual(request.session['exordium__show_live'], True)
@@ -14,22 +14,47 @@ class AlbumDownloadViewTests(ExordiumUserTests):
     Tests for album downloads
     """
 
+    zipfile_path = None
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        For these tests we need to have a place to store our zipfiles.  A
+        single directory is shared by the whole class, and emptied out
+        after each test.
+        """
+        super(AlbumDownloadViewTests, cls).setUpClass()
+        cls.zipfile_path = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Get rid of our zipfile download path.  ``tearDown()`` will have
+        already emptied it out.
+        """
+        if os.path.exists(cls.zipfile_path):
+            os.rmdir(cls.zipfile_path)
+        super(AlbumDownloadViewTests, cls).tearDownClass()
+
     def setUp(self):
         """
-        For these tests we need to have a place to store our zipfiles
+        Point our preferences at the zipfile download path.  One of our
+        tests removes the directory entirely, so make sure it's there.
         """
         super(AlbumDownloadViewTests, self).setUp()
-        self.zipfile_path = tempfile.mkdtemp()
+        os.makedirs(self.zipfile_path, exist_ok=True)
         self.prefs['exordium__zipfile_path'] = self.zipfile_path
         self.prefs['exordium__zipfile_url'] = 'http://testserver-zip/zipfiles'
 
     def tearDown(self):
         """
-        Get rid of our zipfile download path
+        Clear out any zipfiles generated by the test.  We only ever write
+        zipfiles directly into this dir, so there's no need to recurse.
         """
         super(AlbumDownloadViewTests, self).tearDown()
         if os.path.exists(self.zipfile_path):
-            shutil.rmtree(self.zipfile_path)
+            for entry in os.scandir(self.zipfile_path):
+                os.unlink(entry.path)
 
     def test_model_support_zipfile_no_zip_dir(self):
         """
@@ -220,11 +245,10 @@ class AlbumDownloadViewTests(ExordiumUserTests):
         """
         Test to ensure that we can generate zipfiles with files created
         before 1980.  Zipfiles can't store dates prior to 1980, so the
-        zip process will fail.  We catch that exception in the app and
-        then do some nonsense to inject the song with the current
-        timestamp, so we'd like to make sure that works.  Pretty unlikely,
-        but I ended up having a file right near the epoch (possibly on
-        the epoch) due to some past weirdness, no doubt.
+        app has the song's timestamp clamped to the earliest date that
+        zipfiles can store, and we'd like to make sure that works.  Pretty
+        unlikely, but I ended up having a file right near the epoch
+        (possibly on the epoch) due to some past weirdness, no doubt.
         """
         self.add_mp3(artist='Artist', title='Title 1',
             album='Album', filename='song1.mp3', path='Album')
@@ -253,6 +277,7 @@ class AlbumDownloadViewTests(ExordiumUserTests):
 
         with zipfile.ZipFile(zip_file, 'r') as zf:
             self.assertEqual(zf.namelist(), ['Album/song1.mp3'])
+            self.assertEqual(zf.getinfo('Album/song1.mp3').date_time, (1980, 1, 1, 0, 0, 0))
 
     def test_basic_album_download_twice(self):
         """
@@ -381,10 +406,8 @@ class AlbumDownloadViewTests(ExordiumUserTests):
         self.assertIn('filenames', response.context)
         self.assertIn('zip_file', response.context)
         self.assertIn('zip_url', response.context)
-        self.assertEqual(
-            sorted(response.context['filenames']),
-            sorted(['Artist/Tracks/song1.mp3', 'Artist/MoreTracks/song2.mp3'])
-        )
+        self.assertEqual(response.context['filenames'],
+            ['Artist/MoreTracks/song2.mp3', 'Artist/Tracks/song1.mp3'])
         self.assertEqual(response.context['zip_file'], 'Artist_-_%s.zip' % (App.norm_filename(album.name)))
         self.assertContains(response, 'Artist/Tracks/song1.mp3<')
         self.assertContains(response, 'Artist/MoreTracks/song2.mp3<')
@@ -395,8 +418,59 @@ class AlbumDownloadViewTests(ExordiumUserTests):
         self.assertEqual(os.path.exists(zip_file), True)
 
         with zipfile.ZipFile(zip_file, 'r') as zf:
-            self.assertEqual(
-                sorted(zf.namelist()),
-                sorted(['Artist/Tracks/song1.mp3', 'Artist/MoreTracks/song2.mp3'])
-            )
+            self.assertEqual(zf.namelist(),
+                ['Artist/MoreTracks/song2.mp3', 'Artist/Tracks/song1.mp3'])
+
 
+    def test_classical_album_download_queries(self):
+        """
+        Every track on this album has its own artist, group, conductor and
+        composer, all of which get shown on the download page.  Those should
+        all come in along with the songs, rather than one query per track.
+        """
+        for num in range(4):
+            self.add_mp3(artist='Artist %d' % (num+1), title='Title %d' % (num+1),
+                group='Group %d' % (num+1), conductor='Conductor %d' % (num+1),
+                composer='Composer %d' % (num+1), album='Album', tracknum=num+1,
+                filename='song%d.mp3' % (num+1), path='Album')
+        self.run_add()
+
+        albums = list(Album.objects.all())
+        self.assertEqual(len(albums), 1)
+        album = albums[0]
+
+        with self.assertNumLibraryQueries(4):
+            response = self.client.get(reverse('exordium:albumdownload', args=(album.pk,)))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['filenames'],
+            ['Album/song%d.mp3' % (num+1) for num in range(4)])
+        for role in ['groups', 'conductors', 'composers']:
+            self.assertEqual(len(response.context[role]), 4)
+        body = response.content.decode(response.charset)
+        self.assertAllIn(['%s %d' % (role, num+1)
+            for role in ['Group', 'Conductor', 'Composer'] for num in range(4)], body)
+
+    def test_various_album_download_with_art_queries(self):
+        """
+        A multi-track various-artists album with album art.  The album
+        (with its artist) and its songs (with theirs), plus the total length
+        and streamable track list used by the album header, should be all
+        we need, regardless of how many tracks or artists are on the album.
+        """
+        for num in range(4):
+            self.add_mp3(artist='Artist %d' % (num+1), title='Title %d' % (num+1),
+                album='Album', tracknum=num+1, filename='song%d.mp3' % (num+1), path='Album')
+        self.add_art(path='Album')
+        self.run_add()
+
+        albums = list(Album.objects.all())
+        self.assertEqual(len(albums), 1)
+        album = albums[0]
+        self.assertEqual(album.artist.name, 'Various')
+
+        with self.assertNumLibraryQueries(4):
+            response = self.client.get(reverse('exordium:albumdownload', args=(album.pk,)))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['filenames'],
+            ['Album/song%d.mp3' % (num+1) for num in range(4)] + ['Album/cover.jpg'])
+        self.assertEqual(response.context['zip_file'], 'Various_-_Album.zip')
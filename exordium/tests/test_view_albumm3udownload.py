@@ -58,7 +58,10 @@ class AlbumM3UDownloadViewTests(ExordiumTests):
 
         self.assertEqual(Song.objects.count(), 3)
 
-        response = self.client.get(reverse('exordium:m3udownload', args=(album.pk,)))
+        # One query for the album and one for its songs, regardless of
+        # how many tracks there are.
+        with self.assertNumLibraryQueries(2):
+            response = self.client.get(reverse('exordium:m3udownload', args=(album.pk,)))
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['Content-Type'], 'audio/mpegurl')
         self.assertEqual(response['Content-Disposition'], 'attachment; filename=Artist_-_Album.m3u')
@@ -70,3 +73,22 @@ class AlbumM3UDownloadViewTests(ExordiumTests):
             self.assertContains(response, str(song.title))
             self.assertContains(response, song.get_download_url_m3u())
 
+
+    def test_various_artists_album_queries(self):
+        """
+        Each track on a various-artists album has its own artist, which we
+        show for every line in the playlist.  Those should get pulled in
+        along with the songs themselves, rather than one query per track.
+        """
+        album = self.create_album([
+            {'artist': 'Artist %d' % (num+1), 'title': 'Title %d' % (num+1),
+                'tracknum': num+1, 'filename': 'song%d.mp3' % (num+1)}
+            for num in range(4)
+        ], artist='Various')
+
+        with self.assertNumLibraryQueries(2):
+            response = self.client.get(reverse('exordium:m3udownload', args=(album.pk,)))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename=Various_-_Album.m3u')
+        body = response.content.decode(response.charset)
+        self.assertAllIn(['Artist %d / Title %d (Album)' % (num+1, num+1) for num in range(4)], body)
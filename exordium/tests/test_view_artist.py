@@ -11,82 +11,23 @@ class ArtistViewTests(ExordiumTests):
     Tests of our Artist info page
     """
 
-    def test_invalid_artist(self):
-        """
-        Tests making a request for an artist which can't be found.
+    def assertTableOrder(self, response, table, expected, sort_link):
         """
-        response = self.client.get(reverse('exordium:artist', args=('notfound',)))
-        self.assertEqual(response.status_code, 404)
-
-    def test_single_album(self):
-        """
-        Test an artist who only has a single album
+        Asserts that the given table (``albums`` or ``songs``) in the
+        artist page ``response`` contains exactly ``expected``, in order,
+        and that the page links to the next sort with ``sort_link``.
         """
-        self.add_mp3(artist='Artist', title='Title 1',
-            album='Album', filename='song1.mp3')
-        self.run_add()
-        
-        self.assertEqual(Artist.objects.count(), 2)
-        self.assertEqual(Album.objects.count(), 1)
-        self.assertEqual(Song.objects.count(), 1)
-
-        artist = Artist.objects.get(name='Artist')
-        album = Album.objects.get()
-        song = Song.objects.get()
-
-        response = self.client.get(reverse('exordium:artist', args=('artist',)))
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(album)])
-        self.assertEqual(response.context['have_songs'], True)
-        self.assertQuerysetEqual(response.context['songs'].data, [repr(song)])
-        self.assertContains(response, 'Songs by %s' % (artist))
-        self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
-        self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
-        self.assertContains(response, song.get_download_url_html5())
-        self.assertContains(response, song.get_download_url_m3u())
-        self.assertContains(response, '1 album')
-        self.assertContains(response, '1 song')
-
-        # May as well double-check the no-album-art-found image as well
-        self.assertContains(response, '"%s"' % (static('exordium/no_album_art_small.png')))
-
-        # Artist song-list view should not have the tracknum column, and should have album-sort
-        self.assertNotContains(response, 'sort=tracknum')
-        self.assertContains(response, 'song-sort=album')
+        self.assertEqual(len(response.context[table].data), len(expected))
+        self.assertQuerysetEqual(response.context[table].data, expected)
+        self.assertContains(response, sort_link)
 
-    def test_single_album_with_art(self):
+    def test_invalid_artist(self):
         """
-        Test an artist who only has a single album, with album art.
+        Tests making a request for an artist which can't be found.
         """
-        self.add_mp3(artist='Artist', title='Title 1',
-            album='Album', filename='song1.mp3')
-        self.add_art()
-        self.run_add()
-        
-        self.assertEqual(Artist.objects.count(), 2)
-        self.assertEqual(Album.objects.count(), 1)
-        self.assertEqual(Song.objects.count(), 1)
-
-        artist = Artist.objects.get(name='Artist')
-        album = Album.objects.get()
-        song = Song.objects.get()
-
-        response = self.client.get(reverse('exordium:artist', args=('artist',)))
-        self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(album)])
-        self.assertEqual(response.context['have_songs'], True)
-        self.assertQuerysetEqual(response.context['songs'].data, [repr(song)])
-        self.assertContains(response, '1 album')
-        self.assertContains(response, '1 song')
-        self.assertContains(response, 'Songs by %s' % (artist))
-        self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
-        self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
-        self.assertContains(response, reverse('exordium:albumart', args=(album.pk, 'list',)))
-        # These will show up once for HTML5, and once for direct download
-        self.assertContains(response, song.get_download_url_html5())
-        self.assertContains(response, song.get_download_url_m3u())
-        self.assertNotContains(response, 'sort=tracknum')
-        self.assertContains(response, 'song-sort=album')
+        response = self.client.get(reverse('exordium:artist', args=('notfound',)))
+        self.assertEqual(response.status_code, 404)
 
     def test_various_artists(self):
         """
@@ -107,47 +48,45 @@ class ArtistViewTests(ExordiumTests):
         self.assertEqual(Album.objects.count(), 2)
         self.assertEqual(Song.objects.count(), 4)
 
-        artist_1 = Artist.objects.get(name='Artist 1')
-        artist_2 = Artist.objects.get(name='Artist 2')
-        artist_3 = Artist.objects.get(name='Artist 3')
-        various = Artist.objects.get(name='Various')
+        artists = Artist.objects.in_bulk(['Artist 1', 'Artist 2', 'Artist 3', 'Various'], field_name='name')
+        artist_1 = artists['Artist 1']
+        artist_2 = artists['Artist 2']
+        artist_3 = artists['Artist 3']
+        various = artists['Various']
 
-        album_1 = Album.objects.get(name='Album 1')
-        album_2 = Album.objects.get(name='Album 2')
+        albums = {al.name: al for al in Album.objects.all()}
+        album_1 = albums['Album 1']
+        album_2 = albums['Album 2']
 
-        song_1 = Song.objects.get(filename='album_1/song1.mp3')
-        song_2 = Song.objects.get(filename='album_1/song2.mp3')
-        song_3 = Song.objects.get(filename='album_2/song3.mp3')
-        song_4 = Song.objects.get(filename='album_2/song4.mp3')
+        songs = {s.filename: s for s in Song.objects.all()}
+        song_1 = songs['album_1/song1.mp3']
+        song_2 = songs['album_1/song2.mp3']
+        song_3 = songs['album_2/song3.mp3']
+        song_4 = songs['album_2/song4.mp3']
 
         response = self.client.get(reverse('exordium:artist', args=(artist_1.normname,)))
         self.assertEqual(response.status_code, 200)
+        body = response.content.decode(response.charset)
 
         # Only the Various Artists album should show up
-        self.assertContains(response, '1 album')
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(album_1)])
-        self.assertContains(response, reverse('exordium:album', args=(album_1.pk,)))
-        self.assertContains(response, reverse('exordium:artist', args=(various.normname,)))
-        self.assertNotContains(response, str(album_2))
-        self.assertNotContains(response, reverse('exordium:album', args=(album_2.pk,)))
+        self.assertIn('1 album', body)
+        self.assertQuerysetEqual(response.context['albums'].data, [album_1])
+        self.assertIn(reverse('exordium:album', args=(album_1.pk,)), body)
+        self.assertIn(reverse('exordium:artist', args=(various.normname,)), body)
+        self.assertNoneIn([str(album_2), reverse('exordium:album', args=(album_2.pk,))], body)
 
         # Only one song should show up
-        self.assertContains(response, '1 song')
-        self.assertQuerysetEqual(response.context['songs'].data, [repr(song_1)])
-        self.assertContains(response, reverse('exordium:artist', args=(artist_1.normname,)))
-        # This check is a bit silly since it's already shown up above
-        self.assertContains(response, reverse('exordium:album', args=(album_1.pk,)))
-        self.assertContains(response, song_1.get_download_url_html5())
-        self.assertContains(response, song_1.get_download_url_m3u())
-        for song in [song_2, song_3, song_4]:
-            self.assertNotContains(response, str(song))
-            self.assertNotContains(response, song.get_download_url_html5())
-            self.assertNotContains(response, song.get_download_url_m3u())
+        self.assertIn('1 song', body)
+        self.assertQuerysetEqual(response.context['songs'].data, [song_1])
+        self.assertIn(reverse('exordium:artist', args=(artist_1.normname,)), body)
+        self.assertIn(song_1.get_download_url_html5(), body)
+        self.assertIn(song_1.get_download_url_m3u(), body)
+        self.assertNoneIn([needle for song in [song_2, song_3, song_4]
+            for needle in [str(song), song.get_download_url_html5(), song.get_download_url_m3u()]], body)
 
         # Shouldn't see any links to our other two artists
-        for artist in [artist_2, artist_3]:
-            self.assertNotContains(response, str(artist))
-            self.assertNotContains(response, reverse('exordium:artist', args=(artist.normname,)))
+        self.assertNoneIn([needle for artist in [artist_2, artist_3]
+            for needle in [str(artist), reverse('exordium:artist', args=(artist.normname,))]], body)
 
     def test_ordering(self):
         """
@@ -176,35 +115,40 @@ class ArtistViewTests(ExordiumTests):
 
         artist = Artist.objects.get(name='Artist 1')
 
-        self.assertEqual(Album.objects.count(), 4)
-        reg_album_1 = Album.objects.get(name='Album 1')
-        reg_album_2 = Album.objects.get(name='Album 3')
-        va_album = Album.objects.get(name='Album 2')
-        misc_album = Album.objects.get(miscellaneous=True)
+        # Pull in the album artists too, since we check their links below
+        albums = {al.name: al for al in Album.objects.select_related('artist')}
+        self.assertEqual(len(albums), 4)
+        reg_album_1 = albums['Album 1']
+        reg_album_2 = albums['Album 3']
+        va_album = albums['Album 2']
+        misc_album = albums[Album.miscellaneous_format_str % (artist)]
+        self.assertEqual(misc_album.miscellaneous, True)
 
         response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, '4 albums')
-        self.assertContains(response, '6 songs')
+        body = response.content.decode(response.charset)
+        self.assertIn('4 albums', body)
+        self.assertIn('6 songs', body)
         self.assertQuerysetEqual(response.context['albums'].data,
-            [repr(al) for al in [reg_album_1, reg_album_2, misc_album, va_album]])
+            [reg_album_1, reg_album_2, misc_album, va_album])
         self.assertQuerysetEqual(response.context['songs'].data,
-            [repr(s) for s in Song.objects.filter(artist=artist).order_by('title')])
+            Song.objects.filter(artist=artist).order_by('title'))
+
+        # Build each song's title and download URLs just once, split on
+        # whether or not the song should be shown.
+        song_needles = {True: [], False: []}
+        for song in Song.objects.all():
+            song_needles[song.artist_id == artist.pk].extend([str(song.title),
+                song.get_download_url_html5(), song.get_download_url_m3u()])
 
         # There are certainly some duplicate tests happening down here.
+        needles = []
         for album in [reg_album_1, reg_album_2, misc_album, va_album]:
-            self.assertContains(response, str(album))
-            self.assertContains(response, str(album.artist))
-            self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
-            self.assertContains(response, reverse('exordium:artist', args=(album.artist.normname,)))
-        for song in Song.objects.filter(artist=artist):
-            self.assertContains(response, str(song.title))
-            self.assertContains(response, song.get_download_url_html5())
-            self.assertContains(response, song.get_download_url_m3u())
-        for song in Song.objects.exclude(artist=artist):
-            self.assertNotContains(response, str(song.title))
-            self.assertNotContains(response, song.get_download_url_html5())
-            self.assertNotContains(response, song.get_download_url_m3u())
+            needles.extend([str(album), str(album.artist),
+                reverse('exordium:album', args=(album.pk,)),
+                reverse('exordium:artist', args=(album.artist.normname,))])
+        self.assertAllIn(needles + song_needles[True], body)
+        self.assertNoneIn(song_needles[False], body)
 
     def test_classical_as_conductor(self):
         """
@@ -219,35 +163,37 @@ class ArtistViewTests(ExordiumTests):
             album='Album 1', filename='song2.mp3', path='album_1')
         self.run_add()
 
-        self.assertEqual(Artist.objects.count(), 8)
-        artist = Artist.objects.get(name='Conductor 2')
+        artists = {a.name: a for a in Artist.objects.all()}
+        self.assertEqual(len(artists), 8)
+        artist_urls = {name: reverse('exordium:artist', args=(a.normname,)) for (name, a) in artists.items()}
 
-        self.assertEqual(Album.objects.count(), 1)
-        album = Album.objects.get()
+        albums = list(Album.objects.all())
+        self.assertEqual(len(albums), 1)
+        album = albums[0]
 
-        self.assertEqual(Song.objects.count(), 2)
-        song_1 = Song.objects.get(title='Title 1')
-        song_2 = Song.objects.get(title='Title 2')
+        songs = {s.title: s for s in Song.objects.all()}
+        self.assertEqual(len(songs), 2)
+        song_1 = songs['Title 1']
+        song_2 = songs['Title 2']
 
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
+        response = self.client.get(artist_urls['Conductor 2'])
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(album)])
-        self.assertContains(response, '1 album')
-        self.assertQuerysetEqual(response.context['songs'].data, [repr(song_2)])
-        self.assertContains(response, '1 song')
-        self.assertContains(response, str(album))
-        self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
-        
-        for artist in Artist.objects.exclude(name='Various'):
-            self.assertContains(response, str(artist))
-            self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
-
-        self.assertNotContains(response, str(song_1))
-        self.assertNotContains(response, song_1.get_download_url_html5())
-        self.assertNotContains(response, song_1.get_download_url_m3u())
-        self.assertContains(response, str(song_2))
-        self.assertContains(response, song_2.get_download_url_html5())
-        self.assertContains(response, song_2.get_download_url_m3u())
+        body = response.content.decode(response.charset)
+        self.assertQuerysetEqual(response.context['albums'].data, [album])
+        self.assertIn('1 album', body)
+        self.assertQuerysetEqual(response.context['songs'].data, [song_2])
+        self.assertIn('1 song', body)
+        self.assertIn(str(album), body)
+        self.assertIn(reverse('exordium:album', args=(album.pk,)), body)
+
+        needles = []
+        for (name, other) in artists.items():
+            if name != 'Various':
+                needles.extend([str(other), artist_urls[name]])
+        self.assertAllIn(needles, body)
+
+        self.assertNoneIn([str(song_1), song_1.get_download_url_html5(), song_1.get_download_url_m3u()], body)
+        self.assertAllIn([str(song_2), song_2.get_download_url_html5(), song_2.get_download_url_m3u()], body)
 
     def test_classical_as_conductor_various(self):
         """
@@ -263,38 +209,38 @@ class ArtistViewTests(ExordiumTests):
             album='Album 1', filename='song2.mp3', path='album_1')
         self.run_add()
 
-        self.assertEqual(Artist.objects.count(), 9)
-        artist = Artist.objects.get(name='Conductor 2')
+        artists = {a.name: a for a in Artist.objects.all()}
+        self.assertEqual(len(artists), 9)
+        artist_urls = {name: reverse('exordium:artist', args=(a.normname,)) for (name, a) in artists.items()}
 
-        self.assertEqual(Album.objects.count(), 1)
-        album = Album.objects.get()
+        albums = list(Album.objects.all())
+        self.assertEqual(len(albums), 1)
+        album = albums[0]
 
-        self.assertEqual(Song.objects.count(), 2)
-        song_1 = Song.objects.get(title='Title 1')
-        song_2 = Song.objects.get(title='Title 2')
+        songs = {s.title: s for s in Song.objects.all()}
+        self.assertEqual(len(songs), 2)
+        song_1 = songs['Title 1']
+        song_2 = songs['Title 2']
 
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
+        response = self.client.get(artist_urls['Conductor 2'])
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(album)])
-        self.assertContains(response, '1 album')
-        self.assertQuerysetEqual(response.context['songs'].data, [repr(song_2)])
-        self.assertContains(response, '1 song')
-        self.assertContains(response, str(album))
-        self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
-        
-        for artist in Artist.objects.exclude(name='Artist 1'):
-            self.assertContains(response, str(artist))
-            self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
-        for artist in Artist.objects.filter(name='Artist 1'):
-            self.assertNotContains(response, str(artist))
-            self.assertNotContains(response, reverse('exordium:artist', args=(artist.normname,)))
-
-        self.assertNotContains(response, str(song_1))
-        self.assertNotContains(response, song_1.get_download_url_html5())
-        self.assertNotContains(response, song_1.get_download_url_m3u())
-        self.assertContains(response, str(song_2))
-        self.assertContains(response, song_2.get_download_url_html5())
-        self.assertContains(response, song_2.get_download_url_m3u())
+        body = response.content.decode(response.charset)
+        self.assertQuerysetEqual(response.context['albums'].data, [album])
+        self.assertIn('1 album', body)
+        self.assertQuerysetEqual(response.context['songs'].data, [song_2])
+        self.assertIn('1 song', body)
+        self.assertIn(str(album), body)
+        self.assertIn(reverse('exordium:album', args=(album.pk,)), body)
+
+        needles = []
+        for (name, other) in artists.items():
+            if name != 'Artist 1':
+                needles.extend([str(other), artist_urls[name]])
+        self.assertAllIn(needles, body)
+        self.assertNoneIn([str(artists['Artist 1']), artist_urls['Artist 1']], body)
+
+        self.assertNoneIn([str(song_1), song_1.get_download_url_html5(), song_1.get_download_url_m3u()], body)
+        self.assertAllIn([str(song_2), song_2.get_download_url_html5(), song_2.get_download_url_m3u()], body)
 
     def test_pagination(self):
         """
@@ -303,61 +249,47 @@ class ArtistViewTests(ExordiumTests):
         rather than splitting them into separate tests.  We show 50 albums and
         25 songs on the artist page.
         """
-        for num in range(60):
-            self.add_mp3(artist='Artist', title='Title %02d' % (num+1),
-                album='Album %02d' % (num+1), filename='song%d.mp3' % (num+1))
-        self.run_add()
-        self.assertEqual(Album.objects.count(), 60)
+        album_names = ['Album %02d' % (num+1) for num in range(60)]
+        titles = ['Title %02d' % (num+1) for num in range(60)]
+        albums = [self.create_album([{'title': titles[num], 'filename': 'song%d.mp3' % (num+1)}],
+            album=album_names[num]) for num in range(60)]
 
         self.assertEqual(Artist.objects.count(), 2)
-        artist = Artist.objects.get(name='Artist')
+        artist = albums[0].artist
+        self.assertEqual(Song.objects.count(), 60)
 
-        albums = {}
-        for num in range(60):
-            albums[num] = Album.objects.get(name='Album %02d' % (num+1))
+        # Both pages check every album link, so only reverse them once
+        album_urls = [reverse('exordium:album', args=(albums[num].pk,)) for num in range(60)]
 
-        songs = {}
-        for num in range(60):
-            songs[num] = Song.objects.get(title='Title %02d' % (num+1))
+        album_titles = ['%s<' % (name) for name in album_names]
+        song_titles = ['%s<' % (title) for title in titles]
 
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
+        url = reverse('exordium:artist', args=(artist.normname,))
+
+        response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, '50 of 60 albums')
-        self.assertContains(response, '25 of 60 songs')
-        self.assertContains(response, '"?album-page=2"')
-        self.assertContains(response, '"?song-page=2"')
+        body = response.content.decode(response.charset)
+        self.assertIn('50 of 60 albums', body)
+        self.assertIn('25 of 60 songs', body)
+        self.assertIn('"?album-page=2"', body)
+        self.assertIn('"?song-page=2"', body)
         self.assertEqual(len(response.context['albums'].data), 60)
         self.assertEqual(len(response.context['songs'].data), 60)
-        for num in range(50):
-            self.assertContains(response, '%s<' % (albums[num]))
-            self.assertContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        for num in range(50, 60):
-            self.assertNotContains(response, '%s<' % (albums[num]))
-            self.assertNotContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        for num in range(25):
-            self.assertContains(response, '%s<' % (songs[num]))
-        for num in range(25, 60):
-            self.assertNotContains(response, '%s<' % (songs[num]))
+        self.assertAllIn(album_titles[:50] + album_urls[:50] + song_titles[:25], body)
+        self.assertNoneIn(album_titles[50:] + album_urls[50:] + song_titles[25:], body)
 
         # test page 2/3
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)), {'album-page': 2, 'song-page': 3})
+        response = self.client.get(url, {'album-page': 2, 'song-page': 3})
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, '10 of 60 albums')
-        self.assertContains(response, '10 of 60 songs')
-        self.assertContains(response, 'album-page=1')
-        self.assertContains(response, 'song-page=2')
+        body = response.content.decode(response.charset)
+        self.assertIn('10 of 60 albums', body)
+        self.assertIn('10 of 60 songs', body)
+        self.assertIn('album-page=1', body)
+        self.assertIn('song-page=2', body)
         self.assertEqual(len(response.context['albums'].data), 60)
         self.assertEqual(len(response.context['songs'].data), 60)
-        for num in range(50):
-            self.assertNotContains(response, '%s<' % (albums[num]))
-            self.assertNotContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        for num in range(50, 60):
-            self.assertContains(response, '%s<' % (albums[num]))
-            self.assertContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        for num in range(50):
-            self.assertNotContains(response, '%s<' % (songs[num]))
-        for num in range(50, 60):
-            self.assertContains(response, '%s<' % (songs[num]))
+        self.assertNoneIn(album_titles[:50] + album_urls[:50] + song_titles[:50], body)
+        self.assertAllIn(album_titles[50:] + album_urls[50:] + song_titles[50:], body)
 
     def test_sorting_album(self):
         """
@@ -378,19 +310,14 @@ class ArtistViewTests(ExordiumTests):
             Album.objects.get(name='Album 3'),
         ]
         artist = Artist.objects.get(name='Artist')
+        url = reverse('exordium:artist', args=(artist.normname,))
 
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['albums'].data), 3)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(al) for al in albums])
-        self.assertContains(response, '"?album-sort=year"')
+        response = self.client.get(url)
+        self.assertTableOrder(response, 'albums', albums, '"?album-sort=year"')
 
         # test the sorting button
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)), {'album-sort': 'year'})
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['albums'].data), 3)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(al) for al in reversed(albums)])
-        self.assertContains(response, '"?album-sort=-year"')
+        response = self.client.get(url, {'album-sort': 'year'})
+        self.assertTableOrder(response, 'albums', list(reversed(albums)), '"?album-sort=-year"')
 
     def test_sorting_album_year_time_added(self):
         """
@@ -403,26 +330,18 @@ class ArtistViewTests(ExordiumTests):
             album='Album 2', year=2017, filename='song2.mp3')
         self.run_add()
         al2 = self.age_album('Artist', 'Album 2', 10)
-        self.assertEqual(Album.objects.count(), 2)
-
-        albums = [
-            al2,
-            Album.objects.get(name='Album 1'),
-        ]
+        others = list(Album.objects.exclude(pk=al2.pk))
+        self.assertEqual(len(others), 1)
+        albums = [al2, others[0]]
         artist = Artist.objects.get(name='Artist')
+        url = reverse('exordium:artist', args=(artist.normname,))
 
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)), {'album-sort': 'year'})
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['albums'].data), 2)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(al) for al in albums])
-        self.assertContains(response, '"?album-sort=-year"')
+        response = self.client.get(url, {'album-sort': 'year'})
+        self.assertTableOrder(response, 'albums', albums, '"?album-sort=-year"')
 
         # test reverse sort
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)), {'album-sort': '-year'})
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['albums'].data), 2)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(al) for al in reversed(albums)])
-        self.assertContains(response, '"?album-sort=year"')
+        response = self.client.get(url, {'album-sort': '-year'})
+        self.assertTableOrder(response, 'albums', list(reversed(albums)), '"?album-sort=year"')
 
     def test_sorting_song(self):
         """
@@ -443,51 +362,31 @@ class ArtistViewTests(ExordiumTests):
             Song.objects.get(title='Title 3'),
         ]
         artist = Artist.objects.get(name='Artist')
+        url = reverse('exordium:artist', args=(artist.normname,))
 
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['songs'].data), 3)
-        self.assertQuerysetEqual(response.context['songs'].data, [repr(al) for al in songs])
-        self.assertContains(response, '"?song-sort=album"')
+        response = self.client.get(url)
+        self.assertTableOrder(response, 'songs', songs, '"?song-sort=album"')
 
         # test the sorting button
-        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)), {'song-sort': 'album'})
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['songs'].data), 3)
-        self.assertQuerysetEqual(response.context['songs'].data, [repr(al) for al in reversed(songs)])
-        self.assertContains(response, '"?song-sort=-album"')
+        response = self.client.get(url, {'song-sort': 'album'})
+        self.assertTableOrder(response, 'songs', list(reversed(songs)), '"?song-sort=-album"')
 
     def test_too_many_songs(self):
         """
         If an artist has more than 500 songs, the song list won't be
         shown on the artist page.  We're going to cheat here and
-        insert directly into the database rather than going through our
-        ``run_add()`` rigamarole.  Quite possibly I should be doing that
-        on all our pagination tests, too, since those are noticeably
-        slow.  Ah well.
+        insert directly into the database with ``create_album()`` rather
+        than going through our ``run_add()`` rigamarole.
         """
-        artist = Artist.objects.create(name='Artist', normname='artist')
-        album = Album.objects.create(artist=artist, name='Album', normname='album')
-        for num in range(501):
-            Song.objects.create(filename='file%03d.mp3' % (num+1),
-                artist=artist,
-                album=album,
-                title='Title %03d' % (num+1),
-                year=0,
-                tracknum=0,
-                normtitle='title %03d' % (num+1),
-                raw_artist='artist',
-                filetype=Song.MP3,
-                bitrate=128000,
-                mode=Song.CBR,
-                size=123000,
-                length=90,
-                sha256sum='0cf31fc7d968ec16c69758f9b0ebb2355471d5694a151b40e5e4f8641b061092',
-            )
+        album = self.create_album([
+            {'title': 'Title %03d' % (num+1), 'filename': 'file%03d.mp3' % (num+1), 'length': 90}
+            for num in range(501)
+        ])
+        artist = album.artist
 
         response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['albums'].data, [repr(album)])
+        self.assertQuerysetEqual(response.context['albums'].data, [album])
         self.assertEqual(response.context['have_songs'], False)
         self.assertNotIn('songs', response.context)
         self.assertNotContains(response, 'Songs by %s' % (artist))
@@ -496,3 +395,76 @@ class ArtistViewTests(ExordiumTests):
         self.assertContains(response, '1 album')
         self.assertNotContains(response, '1 song')
 
+class SingleAlbumArtistViewTests(ExordiumTests):
+    """
+    Tests of our Artist info page for artists who only have a single
+    album.  These don't modify anything, so they share a couple of
+    albums inserted directly into the database with ``create_album()``.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up one single-album artist without album art, and one with.
+        """
+        super(SingleAlbumArtistViewTests, cls).setUpTestData()
+        cls.album = cls.create_album([{'title': 'Title 1', 'filename': 'song1.mp3'}],
+            artist='Artist')
+        cls.art_album = cls.create_album([{'title': 'Title 2', 'filename': 'song2.mp3'}],
+            artist='Art Artist', art=True)
+
+    def test_single_album(self):
+        """
+        Test an artist who only has a single album
+        """
+        self.assertEqual(Artist.objects.count(), 3)
+
+        album = self.album
+        artist = album.artist
+        song = Song.objects.get(album=album)
+
+        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
+        self.assertEqual(response.status_code, 200)
+        self.assertQuerysetEqual(response.context['albums'].data, [album])
+        self.assertEqual(response.context['have_songs'], True)
+        self.assertQuerysetEqual(response.context['songs'].data, [song])
+        self.assertContains(response, 'Songs by %s' % (artist))
+        self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
+        self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
+        self.assertContains(response, song.get_download_url_html5())
+        self.assertContains(response, song.get_download_url_m3u())
+        self.assertContains(response, '1 album')
+        self.assertContains(response, '1 song')
+
+        # May as well double-check the no-album-art-found image as well
+        self.assertContains(response, '"%s"' % (static('exordium/no_album_art_small.png')))
+
+        # Artist song-list view should not have the tracknum column, and should have album-sort
+        self.assertNotContains(response, 'sort=tracknum')
+        self.assertContains(response, 'song-sort=album')
+
+    def test_single_album_with_art(self):
+        """
+        Test an artist who only has a single album, with album art.
+        """
+        album = self.art_album
+        artist = album.artist
+        song = Song.objects.get(album=album)
+
+        response = self.client.get(reverse('exordium:artist', args=(artist.normname,)))
+        self.assertEqual(response.status_code, 200)
+        self.assertQuerysetEqual(response.context['albums'].data, [album])
+        self.assertEqual(response.context['have_songs'], True)
+        self.assertQuerysetEqual(response.context['songs'].data, [song])
+        self.assertContains(response, '1 album')
+        self.assertContains(response, '1 song')
+        self.assertContains(response, 'Songs by %s' % (artist))
+        self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
+        self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
+        self.assertContains(response, reverse('exordium:albumart', args=(album.pk, 'list',)))
+        self.assertNotContains(response, '"%s"' % (static('exordium/no_album_art_small.png')))
+        # These will show up once for HTML5, and once for direct download
+        self.assertContains(response, song.get_download_url_html5())
+        self.assertContains(response, song.get_download_url_m3u())
+        self.assertNotContains(response, 'sort=tracknum')
+        self.assertContains(response, 'song-sort=album')
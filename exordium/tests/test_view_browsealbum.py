@@ -1,7 +1,8 @@
 from .base import ExordiumTests
 
+import re
+
 from django.urls import reverse
-from django.db.models import Q
 
 from django.templatetags.static import static
 
@@ -12,11 +13,20 @@ class BrowseAlbumViewTests(ExordiumTests):
     Tests of our Browse Album page
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Every test here requests the same page, so only reverse its
+        URL once.
+        """
+        super(BrowseAlbumViewTests, cls).setUpClass()
+        cls.browse_url = reverse('exordium:browse_album')
+
     def test_no_albums(self):
         """
         Test the view when there are no albums
         """
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
         self.assertQuerysetEqual(response.context['table'].data, [])
 
@@ -31,9 +41,9 @@ class BrowseAlbumViewTests(ExordiumTests):
         self.assertEqual(Album.objects.count(), 1)
         album = Album.objects.get()
 
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(album)])
+        self.assertQuerysetEqual(response.context['table'].data, [album])
         self.assertContains(response, '1 album')
         self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
         self.assertContains(response, reverse('exordium:artist', args=(album.artist.normname,)))
@@ -51,9 +61,9 @@ class BrowseAlbumViewTests(ExordiumTests):
         self.assertEqual(Album.objects.count(), 1)
         album = Album.objects.get()
 
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(album)])
+        self.assertQuerysetEqual(response.context['table'].data, [album])
         self.assertContains(response, '1 album')
         self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
         self.assertContains(response, reverse('exordium:artist', args=(album.artist.normname,)))
@@ -79,9 +89,9 @@ class BrowseAlbumViewTests(ExordiumTests):
             Album.objects.get(normname='z album'),
         ]
 
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(al) for al in albums])
+        self.assertQuerysetEqual(response.context['table'].data, albums)
         self.assertContains(response, '3 albums')
         for al in albums:
             self.assertContains(response, reverse('exordium:album', args=(al.pk,)))
@@ -108,9 +118,10 @@ class BrowseAlbumViewTests(ExordiumTests):
             filename='song7.mp3')
         self.run_add()
 
-        self.assertEqual(Album.objects.count(), 7)
-        albums = []
-        for albumname in [
+        all_albums = list(Album.objects.all())
+        self.assertEqual(len(all_albums), 7)
+        by_name = {al.name: al for al in all_albums}
+        albums = [by_name[albumname] for albumname in [
                 'C Album',
                 'S Album',
                 'V Album',
@@ -118,16 +129,16 @@ class BrowseAlbumViewTests(ExordiumTests):
                 Album.miscellaneous_format_str % ('Artist'),
                 Album.miscellaneous_format_str % ('Yellow'),
                 Album.miscellaneous_format_str % ('Zebra'),
-                ]:
-            albums.append(Album.objects.get(name=albumname))
+                ]]
 
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(al) for al in albums])
-        self.assertContains(response, '7 albums')
+        self.assertQuerysetEqual(response.context['table'].data, albums)
+        needles = ['7 albums']
         for al in albums:
-            self.assertContains(response, reverse('exordium:album', args=(al.pk,)))
-            self.assertContains(response, reverse('exordium:artist', args=(al.artist.normname,)))
+            needles.extend([reverse('exordium:album', args=(al.pk,)),
+                reverse('exordium:artist', args=(al.artist.normname,))])
+        self.assertAllIn(needles, response.content.decode(response.charset))
 
     def test_classical_album(self):
         """
@@ -138,21 +149,22 @@ class BrowseAlbumViewTests(ExordiumTests):
             album='Album 1', filename='song1.mp3')
         self.run_add()
 
-        self.assertEqual(Artist.objects.count(), 5)
-        self.assertEqual(Album.objects.count(), 1)
+        artists = {a.name: a for a in Artist.objects.all()}
+        self.assertEqual(len(artists), 5)
+        albums = list(Album.objects.all())
+        self.assertEqual(len(albums), 1)
+        album = albums[0]
 
-        album = Album.objects.get()
-        artists = []
-
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(album)])
+        self.assertQuerysetEqual(response.context['table'].data, [album])
         self.assertContains(response, 'Album 1')
         self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
         self.assertContains(response, reverse('exordium:artist', args=(album.artist.normname,)))
-        for artist in Artist.objects.exclude(name='Various'):
-            self.assertContains(response, str(artist))
-            self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
+        for (name, artist) in artists.items():
+            if name != 'Various':
+                self.assertContains(response, str(artist))
+                self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
 
     def test_classical_album_two_tracks(self):
         """
@@ -167,21 +179,22 @@ class BrowseAlbumViewTests(ExordiumTests):
             album='Album 1', filename='song2.mp3')
         self.run_add()
 
-        self.assertEqual(Artist.objects.count(), 8)
-        self.assertEqual(Album.objects.count(), 1)
-
-        album = Album.objects.get()
-        artists = []
+        artists = {a.name: a for a in Artist.objects.all()}
+        self.assertEqual(len(artists), 8)
+        albums = list(Album.objects.all())
+        self.assertEqual(len(albums), 1)
+        album = albums[0]
 
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(album)])
+        self.assertQuerysetEqual(response.context['table'].data, [album])
         self.assertContains(response, 'Album 1')
         self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
         self.assertContains(response, reverse('exordium:artist', args=(album.artist.normname,)))
-        for artist in Artist.objects.exclude(name='Various'):
-            self.assertContains(response, str(artist))
-            self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
+        for (name, artist) in artists.items():
+            if name != 'Various':
+                self.assertContains(response, str(artist))
+                self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
 
     def test_various_album(self):
         """
@@ -200,9 +213,9 @@ class BrowseAlbumViewTests(ExordiumTests):
         various = Artist.objects.get(name='Various')
         album = Album.objects.get()
 
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(album)])
+        self.assertQuerysetEqual(response.context['table'].data, [album])
         self.assertContains(response, 'Album')
         self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
         self.assertContains(response, reverse('exordium:artist', args=(album.artist.normname,)))
@@ -224,67 +237,27 @@ class BrowseAlbumViewTests(ExordiumTests):
             album='Album 1', filename='song2.mp3')
         self.run_add()
 
-        self.assertEqual(Artist.objects.count(), 9)
-        self.assertEqual(Album.objects.count(), 1)
-
-        album = Album.objects.get()
-        artists = []
-
-        various = Artist.objects.get(name='Various')
+        artists = {a.name: a for a in Artist.objects.all()}
+        self.assertEqual(len(artists), 9)
+        albums = list(Album.objects.all())
+        self.assertEqual(len(albums), 1)
+        album = albums[0]
+        various = artists['Various']
 
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(album)])
+        self.assertQuerysetEqual(response.context['table'].data, [album])
         self.assertContains(response, 'Album 1')
         self.assertContains(response, reverse('exordium:album', args=(album.pk,)))
         self.assertContains(response, reverse('exordium:artist', args=(album.artist.normname,)))
         self.assertContains(response, reverse('exordium:artist', args=(various.normname,)))
-        for artist in Artist.objects.exclude(Q(name='Artist 1') | Q(name='Artist 2')):
-            self.assertContains(response, str(artist))
-            self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
-        for artist in Artist.objects.filter(Q(name='Artist 1') | Q(name='Artist 2')):
-            self.assertNotContains(response, str(artist))
-            self.assertNotContains(response, reverse('exordium:artist', args=(artist.normname,)))
-
-    def test_pagination(self):
-        """
-        Test to make sure that our pagination is working properly.
-        The album browse page will show a total of 50 albums
-        """
-        for num in range(60):
-            self.add_mp3(artist='Artist', title='Title %d' % (num+1),
-                album='Album %02d' % (num+1), filename='song%d.mp3' % (num+1))
-        self.run_add()
-        self.assertEqual(Album.objects.count(), 60)
-
-        albums = {}
-        for num in range(60):
-            albums[num] = Album.objects.get(name='Album %02d' % (num+1))
-
-        response = self.client.get(reverse('exordium:browse_album'))
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['table'].data), 60)
-        for num in range(50):
-            self.assertContains(response, '%s<' % (albums[num]))
-            self.assertContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        for num in range(50, 60):
-            self.assertNotContains(response, '%s<' % (albums[num]))
-            self.assertNotContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        self.assertContains(response, '50 of 60 albums')
-        self.assertContains(response, '"?page=2"')
-
-        # test page 2
-        response = self.client.get(reverse('exordium:browse_album'), {'page': 2})
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['table'].data), 60)
-        for num in range(50):
-            self.assertNotContains(response, '%s<' % (albums[num]))
-            self.assertNotContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        for num in range(50, 60):
-            self.assertContains(response, '%s<' % (albums[num]))
-            self.assertContains(response, reverse('exordium:album', args=(albums[num].pk,)))
-        self.assertContains(response, '10 of 60 albums')
-        self.assertContains(response, '"?page=1"')
+        for (name, artist) in artists.items():
+            if name in ['Artist 1', 'Artist 2']:
+                self.assertNotContains(response, str(artist))
+                self.assertNotContains(response, reverse('exordium:artist', args=(artist.normname,)))
+            else:
+                self.assertContains(response, str(artist))
+                self.assertContains(response, reverse('exordium:artist', args=(artist.normname,)))
 
     def test_sorting(self):
         """
@@ -304,16 +277,77 @@ class BrowseAlbumViewTests(ExordiumTests):
             Album.objects.get(name='Album 2'),
             Album.objects.get(name='Album 3'),
         ]
-        response = self.client.get(reverse('exordium:browse_album'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['table'].data), 3)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(al) for al in albums])
+        self.assertQuerysetEqual(response.context['table'].data, albums)
         self.assertContains(response, '"?sort=artist"')
 
         # test the sorting button
-        response = self.client.get(reverse('exordium:browse_album'), {'sort': 'artist'})
+        response = self.client.get(self.browse_url, {'sort': 'artist'})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['table'].data), 3)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(al) for al in reversed(albums)])
+        self.assertQuerysetEqual(response.context['table'].data, list(reversed(albums)))
         self.assertContains(response, '"?sort=-artist"')
 
+class BrowseAlbumPaginationViewTests(ExordiumTests):
+    """
+    Tests of pagination on our Browse Album page, which will show a
+    total of 50 albums.  Our 60 albums are imported directly into the
+    database with ``create_album()``, once for the whole class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Every test here requests the same page and scans it for the same
+        album links, so only reverse the URLs once.
+        """
+        super(BrowseAlbumPaginationViewTests, cls).setUpClass()
+        cls.browse_url = reverse('exordium:browse_album')
+
+        # Matches every album link on a page, so that we can check
+        # exactly which albums a page links to in a single scan.
+        cls.album_link_re = re.compile('href="(%s)"' % (
+            re.escape(reverse('exordium:album', args=(999999,))).replace('999999', '[0-9]+')))
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up the 60 albums which both pages are checked against, along
+        with the album names and links we expect to find on each page.
+        """
+        super(BrowseAlbumPaginationViewTests, cls).setUpTestData()
+        cls.names = {1: [], 2: []}
+        cls.links = {1: set(), 2: set()}
+        for num in range(60):
+            album = cls.create_album([{'title': 'Title %d' % (num+1), 'filename': 'song%d.mp3' % (num+1)}],
+                album='Album %02d' % (num+1))
+            page = 1 if num < 50 else 2
+            cls.names[page].append('%s<' % (album))
+            cls.links[page].add(reverse('exordium:album', args=(album.pk,)))
+
+    def test_page1_listing(self):
+        """
+        Test the first page of albums
+        """
+        self.assertEqual(Album.objects.count(), 60)
+        response = self.client.get(self.browse_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['table'].data), 60)
+        body = response.content.decode(response.charset)
+        self.assertAllIn(self.names[1] + ['50 of 60 albums', '"?page=2"'], body)
+        self.assertNoneIn(self.names[2], body)
+        self.assertEqual(set(self.album_link_re.findall(body)), self.links[1])
+
+    def test_page2_listing(self):
+        """
+        Test the second page of albums
+        """
+        response = self.client.get(self.browse_url, {'page': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['table'].data), 60)
+        body = response.content.decode(response.charset)
+        self.assertAllIn(self.names[2] + ['10 of 60 albums', '"?page=1"'], body)
+        self.assertNoneIn(self.names[1], body)
+        self.assertEqual(set(self.album_link_re.findall(body)), self.links[2])
@@ -1,5 +1,7 @@
 from .base import ExordiumTests
 
+import re
+
 from django.urls import reverse
 
 from exordium.models import Artist, Album, Song, App, AlbumArt
@@ -9,15 +11,24 @@ class BrowseArtistViewTests(ExordiumTests):
     Tests of our Browse Artists page
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Every test here requests the same page, so only reverse its
+        URL once.
+        """
+        super(BrowseArtistViewTests, cls).setUpClass()
+        cls.browse_url = reverse('exordium:browse_artist')
+
     def test_no_artists(self):
         """
         Test the view when there are no artists (except for Various)
         """
         various = Artist.objects.get()
 
-        response = self.client.get(reverse('exordium:browse_artist'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(various)])
+        self.assertQuerysetEqual(response.context['table'].data, [various])
         self.assertContains(response, '1 artist')
         self.assertContains(response, reverse('exordium:artist', args=(various.normname,)))
 
@@ -32,9 +43,9 @@ class BrowseArtistViewTests(ExordiumTests):
         various = Artist.objects.get(normname='various')
         artist = Artist.objects.get(normname='artist')
 
-        response = self.client.get(reverse('exordium:browse_artist'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data, [repr(artist), repr(various)])
+        self.assertQuerysetEqual(response.context['table'].data, [artist, various])
         self.assertContains(response, '2 artists')
         for a in [various, artist]:
             self.assertContains(response, reverse('exordium:artist', args=(a.normname,)))
@@ -61,14 +72,12 @@ class BrowseArtistViewTests(ExordiumTests):
 
         # add Various to our list, in the properly-sorted place.
         artists.insert(9, 'Various')
-        artist_objs = []
-        for artist in artists:
-            artist_objs.append(Artist.objects.get(name=artist))
+        by_name = Artist.objects.in_bulk(artists, field_name='name')
+        artist_objs = [by_name[artist] for artist in artists]
 
-        response = self.client.get(reverse('exordium:browse_artist'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data,
-            [repr(artist) for artist in artist_objs])
+        self.assertQuerysetEqual(response.context['table'].data, artist_objs)
         self.assertContains(response, '11 artists')
         for artist in artist_objs:
             self.assertContains(response, reverse('exordium:artist',
@@ -83,67 +92,19 @@ class BrowseArtistViewTests(ExordiumTests):
             title='Title', album='Album', filename='song1.mp3')
         self.run_add()
 
-        self.assertEqual(Artist.objects.count(), 5)
-        artists = [
-            Artist.objects.get(name='Artist'),
-            Artist.objects.get(name='Composer'),
-            Artist.objects.get(name='Conductor'),
-            Artist.objects.get(name='Group'),
-            Artist.objects.get(name='Various'),
-        ]
+        by_name = Artist.objects.in_bulk(field_name='name')
+        self.assertEqual(len(by_name), 5)
+        artists = [by_name[name] for name in ['Artist', 'Composer', 'Conductor', 'Group', 'Various']]
 
-        response = self.client.get(reverse('exordium:browse_artist'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
-        self.assertQuerysetEqual(response.context['table'].data,
-            [repr(artist) for artist in artists])
+        self.assertQuerysetEqual(response.context['table'].data, artists)
         self.assertContains(response, '5 artists')
         for artist in artists:
             self.assertContains(response, str(artist))
             self.assertContains(response, reverse('exordium:artist',
                 args=(artist.normname,)))
 
-    def test_pagination(self):
-        """
-        Test to make sure that our pagination is working properly.
-        The Browse Artists page will show a total of 25 artists
-        """
-        for num in range(30):
-            self.add_mp3(artist='Artist %02d' % (num+1), title='Title %d' % (num+1),
-                album='Album %d' % (num+1), filename='song%d.mp3' % (num+1))
-        self.run_add()
-        self.assertEqual(Artist.objects.count(), 31)
-
-        artists = {}
-        for num in range(30):
-            artists[num] = Artist.objects.get(name='Artist %02d' % (num+1))
-
-        response = self.client.get(reverse('exordium:browse_artist'))
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['table'].data), 31)
-        for num in range(25):
-            self.assertContains(response, '%s<' % (artists[num]))
-            self.assertContains(response, reverse('exordium:artist', args=(artists[num].normname,)))
-        for num in range(25, 30):
-            self.assertNotContains(response, '%s<' % (artists[num]))
-            self.assertNotContains(response, reverse('exordium:artist', args=(artists[num].normname,)))
-        self.assertNotContains(response, 'Various<')
-        self.assertContains(response, '25 of 31 artists')
-        self.assertContains(response, '"?page=2"')
-
-        # test page 2
-        response = self.client.get(reverse('exordium:browse_artist'), {'page': 2})
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['table'].data), 31)
-        for num in range(25):
-            self.assertNotContains(response, '%s<' % (artists[num]))
-            self.assertNotContains(response, reverse('exordium:artist', args=(artists[num].normname,)))
-        for num in range(25, 30):
-            self.assertContains(response, '%s<' % (artists[num]))
-            self.assertContains(response, reverse('exordium:artist', args=(artists[num].normname,)))
-        self.assertContains(response, 'Various<')
-        self.assertContains(response, '6 of 31 artists')
-        self.assertContains(response, '"?page=1"')
-
     def test_sorting(self):
         """
         Test at least one sort
@@ -159,16 +120,80 @@ class BrowseArtistViewTests(ExordiumTests):
         artist_b = Artist.objects.get(normname='b artist')
 
         # Initial view, artist name.
-        response = self.client.get(reverse('exordium:browse_artist'))
+        response = self.client.get(self.browse_url)
         self.assertEqual(response.status_code, 200)
         self.assertQuerysetEqual(response.context['table'].data,
-            [repr(artist_a), repr(artist_b), repr(various)])
+            [artist_a, artist_b, various])
         self.assertContains(response, "?sort=-name")
 
         # Now sort by name descending
-        response = self.client.get(reverse('exordium:browse_artist'), {'sort': '-name'})
+        response = self.client.get(self.browse_url, {'sort': '-name'})
         self.assertEqual(response.status_code, 200)
         self.assertQuerysetEqual(response.context['table'].data,
-            [repr(various), repr(artist_b), repr(artist_a)])
+            [various, artist_b, artist_a])
         self.assertContains(response, "?sort=name")
 
+class BrowseArtistPaginationViewTests(ExordiumTests):
+    """
+    Tests of pagination on our Browse Artists page, which will show a
+    total of 25 artists.  Our 30 artists are imported directly into the
+    database with ``create_album()``, once for the whole class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Every test here requests the same page and scans it for the same
+        artist links, so only reverse the URLs once.
+        """
+        super(BrowseArtistPaginationViewTests, cls).setUpClass()
+        cls.browse_url = reverse('exordium:browse_artist')
+
+        # Matches every artist link on a page, so that we can check
+        # exactly which artists a page links to in a single scan.
+        cls.artist_link_re = re.compile('href="(%s)"' % (
+            re.escape(reverse('exordium:artist', args=('ARTIST',))).replace('ARTIST', '[^/"]+')))
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Sets up the 30 artists which both pages are checked against, along
+        with the artist names and links we expect to find on each page.
+        """
+        super(BrowseArtistPaginationViewTests, cls).setUpTestData()
+
+        # Various sorts at the very end, on page 2
+        various = Artist.objects.get(normname='various')
+        cls.names = {1: [], 2: ['%s<' % (various)]}
+        cls.links = {1: set(), 2: {reverse('exordium:artist', args=(various.normname,))}}
+        for num in range(30):
+            artist = cls.create_album([{'title': 'Title %d' % (num+1), 'filename': 'song%d.mp3' % (num+1)}],
+                artist='Artist %02d' % (num+1), album='Album %d' % (num+1)).artist
+            page = 1 if num < 25 else 2
+            cls.names[page].append('%s<' % (artist))
+            cls.links[page].add(reverse('exordium:artist', args=(artist.normname,)))
+
+    def test_page1_listing(self):
+        """
+        Test the first page of artists
+        """
+        self.assertEqual(Artist.objects.count(), 31)
+        response = self.client.get(self.browse_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['table'].data), 31)
+        body = response.content.decode(response.charset)
+        self.assertAllIn(self.names[1] + ['25 of 31 artists', '"?page=2"'], body)
+        self.assertNoneIn(self.names[2], body)
+        self.assertEqual(set(self.artist_link_re.findall(body)), self.links[1])
+
+    def test_page2_listing(self):
+        """
+        Test the second page of artists
+        """
+        response = self.client.get(self.browse_url, {'page': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['table'].data), 31)
+        body = response.content.decode(response.charset)
+        self.assertAllIn(self.names[2] + ['6 of 31 artists', '"?page=1"'], body)
+        self.assertNoneIn(self.names[1], body)
+        self.assertEqual(set(self.artist_link_re.findall(body)), self.links[2])
@@ -2,7 +2,7 @@ from django.shortcuts import render, get_object_or_404
 from django.views import generic
 from django.utils.decorators import method_decorator
 from django.contrib.admin.views.decorators import staff_member_required
-from django.db.models import Q
+from django.db.models import Q, Prefetch
 from django.urls import reverse
 from django.template import loader
 from django.http import HttpResponse, StreamingHttpResponse, Http404, HttpResponseRedirect
@@ -119,6 +119,7 @@ class TitleListView(generic.ListView, UserAwareView):
         context = super(TitleListView, self).get_context_data(**kwargs)
         context['exordium_title'] = self.exordium_title
         context['exordium_version'] = __version__
+        context['show_live'] = self.get_preference('show_live')
         populate_session_msg_context(self.request, context)
         return context
 
@@ -136,6 +137,7 @@ class TitleDetailView(generic.DetailView, UserAwareView):
         context = super(TitleDetailView, self).get_context_data(**kwargs)
         context['exordium_title'] = self.exordium_title
         context['exordium_version'] = __version__
+        context['show_live'] = self.get_preference('show_live')
         populate_session_msg_context(self.request, context)
         return context
 
@@ -153,6 +155,7 @@ class TitleTemplateView(generic.TemplateView, UserAwareView):
         context = super(TitleTemplateView, self).get_context_data(**kwargs)
         context['exordium_title'] = self.exordium_title
         context['exordium_version'] = __version__
+        context['show_live'] = self.get_preference('show_live')
         populate_session_msg_context(self.request, context)
         return context
 
@@ -327,34 +330,39 @@ class AlbumDownloadView(TitleDetailView):
     model = Album
     template_name = 'exordium/album_download.html'
 
+    def get_queryset(self):
+        """
+        Pull in our artist and songs along with the album itself, since
+        we loop over the songs a few times while building the zipfile
+        and the page.  The songs bring their group/conductor/composer
+        along too, for ``get_secondary_artists_tuple()``.
+        """
+        return Album.objects.select_related('artist').prefetch_related(
+            Prefetch('song_set', queryset=Song.objects.select_related('artist', 'group', 'conductor', 'composer')))
+
     def get_context_data(self, **kwargs):
         context = super(AlbumDownloadView, self).get_context_data(**kwargs)
         context['show_download_button'] = False
-        context['show_html5_stream_button'] = any([s.filetype != Song.OPUS for s in Song.objects.filter(album=self.object)])
+        context['show_html5_stream_button'] = any([s.filetype != Song.OPUS for s in self.object.song_set.all()])
         (groups, have_empty_group, conductors, have_empty_conductor,
             composers, have_empty_composer) = self.object.get_secondary_artists_tuple()
-        if App.support_zipfile():
-            try:
-                (filenames, zipfile) = self.object.create_zip()
-                context['filenames'] = filenames
-                context['zip_file'] = zipfile
-            except App.AlbumZipfileError as e:  # pragma: no cover
-                context['error'] = 'There was a problem generating the zipfile: %s' % (e.orig_exception)
-            except App.AlbumZipfileNotSupported: # pragma: no cover
-                # There's actually no way to get here, since we test for App.support_zipfile()
-                # before we even try to create a zipfile.  Still, I'll keep it here just in
-                # case there's ever some weird bug which allows us to keep going even though
-                # we don't support it.
-                context['error'] = 'Exordium is not currently configured to allow zipfile creation'
-            except App.AlbumZipfileAlreadyExists as e:
-                context['error'] = 'Zipfile already exists.  You should be able to download with the link below.'
-                context['zip_file'] = e.filename
-                context['zip_mtime'] = e.timestamp
-            finally:
-                if 'zip_file' in context:
-                    context['zip_url'] = '%s/%s' % (App.prefs['exordium__zipfile_url'], context['zip_file'])
-        else:
+        # ``create_zip()`` checks ``App.support_zipfile()`` itself, so rather
+        # than checking it twice per request, just let it tell us.
+        try:
+            (filenames, zipfile) = self.object.create_zip()
+            context['filenames'] = filenames
+            context['zip_file'] = zipfile
+        except App.AlbumZipfileError as e:  # pragma: no cover
+            context['error'] = 'There was a problem generating the zipfile: %s' % (e.orig_exception)
+        except App.AlbumZipfileNotSupported:
             context['error'] = 'Exordium is not currently configured to allow zipfile creation'
+        except App.AlbumZipfileAlreadyExists as e:
+            context['error'] = 'Zipfile already exists.  You should be able to download with the link below.'
+            context['zip_file'] = e.filename
+            context['zip_mtime'] = e.timestamp
+        finally:
+            if 'zip_file' in context:
+                context['zip_url'] = '%s/%s' % (App.prefs['exordium__zipfile_url'], context['zip_file'])
         context['exordium_title'] = '%s / %s' % (self.object.artist, self.object)
         context['groups'] = groups
         context['conductors'] = conductors
@@ -449,6 +457,7 @@ class LibraryUpdateView(generic.View, UserAwareView):
             'request': self.request,
             'exordium_title': title,
             'exordium_version': __version__,
+            'show_live': self.get_preference('show_live'),
             'update_type': update_type,
             'debug': debug,
         }
@@ -531,6 +540,8 @@ class AlbumArtView(generic.View, UserAwareView):
 def updateprefs(request):
     """
     Handler to update our preferences.  Will redirect back to the page we were just on.
+    Only the preferences which are actually on our preferences form get set - since
+    they're submitted as checkboxes, one which isn't present in the POST is set to False.
     """
     if 'show_live' in request.POST:
         UserAwareView.set_preference_static(request, 'show_live', True)
@@ -552,6 +563,13 @@ class AlbumM3UDownloadView(generic.DetailView, UserAwareView):
     template_name = 'exordium/album_stream.m3u'
     content_type = 'audio/mpegurl'
 
+    def get_queryset(self):
+        """
+        Our filename is built from the album artist, so pull that in
+        along with the album.
+        """
+        return Album.objects.select_related('artist')
+
     def render_to_response(self, context, **kwargs):
         """
         Override to set a custom headers